@@ -21,6 +21,45 @@ RELATIONSHIP_FILTER = (
     "BASED_ON|FINE_TUNED|FINETUNED|ADAPTERS|MERGES|QUANTIZATIONS|TRAINED_ON"
 )
 
+
+# Cypher queries are kept as module constants so identical query text is sent on
+# every call and the server-side plan cache can reuse the compiled plan.
+MODELS_QUERY = "MATCH (n:Model) RETURN n ORDER BY n.downloads DESC"
+DATASETS_QUERY = "MATCH (n:Dataset) RETURN n ORDER BY n.downloads DESC"
+ROOT_QUERY = """
+    MATCH (root:Model {model_id: $model_id})
+    RETURN root
+    UNION ALL
+    MATCH (root:Dataset {dataset_id: $model_id})
+    RETURN root
+"""
+# Models that were TRAINED_ON the dataset (downstream from the dataset perspective)
+DATASET_DOWNSTREAM_QUERY = """
+    MATCH (root:Dataset {dataset_id: $model_id})<-[r:TRAINED_ON]-(model:Model)
+    RETURN model as downstream, type(r) as rel_type
+    ORDER BY model.downloads DESC
+    LIMIT $limit
+"""
+# Datasets rarely have upstream relationships; match any node (Model or Dataset)
+DATASET_UPSTREAM_QUERY = """
+    MATCH (root:Dataset {dataset_id: $model_id})-[r]->(upstream)
+    RETURN upstream, type(r) as rel_type
+    ORDER BY COALESCE(upstream.downloads, 0) DESC
+    LIMIT $limit
+"""
+MODEL_UPSTREAM_QUERY = f"""
+    MATCH (root:Model {{model_id: $model_id}})-[r:{RELATIONSHIP_FILTER}]->(upstream)
+    RETURN upstream, type(r) as rel_type
+    ORDER BY COALESCE(upstream.downloads, 0) DESC
+    LIMIT $limit
+"""
+MODEL_DOWNSTREAM_QUERY = f"""
+    MATCH (root:Model {{model_id: $model_id}})<-[r:{RELATIONSHIP_FILTER}]-(downstream:Model)
+    RETURN downstream, type(r) as rel_type
+    ORDER BY downstream.downloads DESC
+    LIMIT $limit
+"""
+
 driver = neo4j.GraphDatabase.driver(NEO4J_URI, auth=NEO4J_AUTH)
 
 
@@ -96,7 +135,7 @@ def _log_query_summary(summary: neo4j.QueryResultSummary, record_count: int) ->
 def search_models() -> HFNodes:
     """Search for all models in the Neo4j database (most downloaded)."""
     res, summary, _ = driver.execute_query(
-        "MATCH (n:Model) RETURN n ORDER BY n.downloads DESC",
+        MODELS_QUERY,
         routing_=neo4j.RoutingControl.READ,
     )
 
@@ -114,7 +153,7 @@ def search_models() -> HFNodes:
 def search_datasets() -> HFNodes:
     """Search for all datasets in the Neo4j database (most downloaded)."""
     res, summary, _ = driver.execute_query(
-        "MATCH (n:Dataset) RETURN n ORDER BY n.downloads DESC",
+        DATASETS_QUERY,
         routing_=neo4j.RoutingControl.READ,
     )
 
@@ -142,31 +181,13 @@ def search_query_impl(model_id: str) -> HFGraphData:
     logger.info(f"Searching Neo4j for model or dataset: {model_id}")
     MAX_RELATED = 10  # cap related models to avoid overly large trees
 
-    # First, try to find as Model
-    model_query = """
-        MATCH (root:Model {model_id: $model_id})
-        RETURN root
-    """
+    # Look up the ID as a Model and as a Dataset in a single round-trip
     root_res, _, _ = driver.execute_query(
-        model_query,
+        ROOT_QUERY,
         model_id=model_id,
         routing_=neo4j.RoutingControl.READ,
     )
 
-    is_dataset = False
-    if not root_res:
-        # Try as Dataset
-        dataset_query = """
-            MATCH (root:Dataset {dataset_id: $model_id})
-            RETURN root
-        """
-        root_res, _, _ = driver.execute_query(
-            dataset_query,
-            model_id=model_id,
-            routing_=neo4j.RoutingControl.READ,
-        )
-        is_dataset = True
-
     if not root_res:
         logger.warning(f"Model or dataset {model_id} not found in Neo4j")
         return HFGraphData(
@@ -174,7 +195,11 @@ def search_query_impl(model_id: str) -> HFGraphData:
             relationships=HFRelationships(relationships=[]),
         )
 
-    root_node_dict = root_res[0].data()["root"]
+    # Prefer the Model if a Model and a Dataset share the same ID
+    root_node_dicts = [record.data()["root"] for record in root_res]
+    root_node_dict = next(
+        (node for node in root_node_dicts if "model_id" in node), root_node_dicts[0]
+    )
     root_entity = _make_entity(root_node_dict)
     if not isinstance(root_entity, (HFModel, HFDataset)):
         logger.error(f"Root node {model_id} is neither a Model nor a Dataset")
@@ -182,6 +207,7 @@ def search_query_impl(model_id: str) -> HFGraphData:
             nodes=HFNodes(nodes=[]),
             relationships=HFRelationships(relationships=[]),
         )
+    is_dataset = isinstance(root_entity, HFDataset)
 
     upstream_res = []
     downstream_res = []
@@ -189,28 +215,15 @@ def search_query_impl(model_id: str) -> HFGraphData:
     if is_dataset:
         # For datasets: find models that were TRAINED_ON this dataset
         # These are "downstream" from the dataset perspective (models that use the dataset)
-        downstream_query = """
-            MATCH (root:Dataset {dataset_id: $model_id})<-[r:TRAINED_ON]-(model:Model)
-            RETURN model as downstream, type(r) as rel_type
-            ORDER BY model.downloads DESC
-            LIMIT $limit
-        """
         downstream_res, _, _ = driver.execute_query(
-            downstream_query,
+            DATASET_DOWNSTREAM_QUERY,
             model_id=model_id,
             limit=MAX_RELATED,
             routing_=neo4j.RoutingControl.READ,
         )
         # Datasets typically don't have upstream relationships, but check anyway
-        # Match any upstream node (Model or Dataset)
-        upstream_query = """
-            MATCH (root:Dataset {dataset_id: $model_id})-[r]->(upstream)
-            RETURN upstream, type(r) as rel_type
-            ORDER BY COALESCE(upstream.downloads, 0) DESC
-            LIMIT $limit
-        """
         upstream_res, _, _ = driver.execute_query(
-            upstream_query,
+            DATASET_UPSTREAM_QUERY,
             model_id=model_id,
             limit=MAX_RELATED,
             routing_=neo4j.RoutingControl.READ,
@@ -219,14 +232,8 @@ def search_query_impl(model_id: str) -> HFGraphData:
         # For models: existing logic for model-to-model relationships
         # Get upstream models/datasets first (consume most of the limit)
         # Match any upstream node (Model or Dataset) - filter in Python
-        upstream_query = """
-            MATCH (root:Model {model_id: $model_id})-[r:BASED_ON|FINE_TUNED|FINETUNED|ADAPTERS|MERGES|QUANTIZATIONS|TRAINED_ON]->(upstream)
-            RETURN upstream, type(r) as rel_type
-            ORDER BY COALESCE(upstream.downloads, 0) DESC
-            LIMIT $limit
-        """
         upstream_res, _, _ = driver.execute_query(
-            upstream_query,
+            MODEL_UPSTREAM_QUERY,
             model_id=model_id,
             limit=MAX_RELATED,
             routing_=neo4j.RoutingControl.READ,
@@ -235,78 +242,65 @@ def search_query_impl(model_id: str) -> HFGraphData:
         # Remaining budget for downstream (downstream -> queried_model, derivatives of queried model)
         remaining_budget = max(0, MAX_RELATED - len(upstream_res))
         if remaining_budget > 0:
-            downstream_query = """
-                MATCH (root:Model {model_id: $model_id})<-[r:BASED_ON|FINE_TUNED|FINETUNED|ADAPTERS|MERGES|QUANTIZATIONS|TRAINED_ON]-(downstream:Model)
-                RETURN downstream, type(r) as rel_type
-                ORDER BY downstream.downloads DESC
-                LIMIT $limit
-            """
             downstream_res, _, _ = driver.execute_query(
-                downstream_query,
+                MODEL_DOWNSTREAM_QUERY,
                 model_id=model_id,
                 limit=remaining_budget,
                 routing_=neo4j.RoutingControl.READ,
             )
 
-    def _ensure_entity(node: HFModel | HFDataset | dict) -> HFModel | HFDataset:
-        if isinstance(node, (HFModel, HFDataset)):
-            return node
-        return _make_entity(node)
+    def _node_key(node_dict: dict) -> tuple[str, str] | None:
+        """Key a node by kind and ID; model and dataset IDs are separate namespaces."""
+        if "model_id" in node_dict:
+            return ("model", node_dict["model_id"])
+        if "dataset_id" in node_dict:
+            return ("dataset", node_dict["dataset_id"])
+        return None
 
-    def _get_entity_id(entity: HFModel | HFDataset) -> str:
-        """Get the ID field from either Model or Dataset."""
-        if isinstance(entity, HFModel):
-            return entity.model_id
-        elif isinstance(entity, HFDataset):
-            return entity.dataset_id
-        raise ValueError(f"Unknown entity type: {type(entity)}")
+    def _get_or_make_entity(node_dict: dict) -> HFModel | HFDataset:
+        """Return the collected entity for node_dict, building it only if unseen."""
+        key = _node_key(node_dict)
+        entity = all_nodes_dict.get(key)
+        if entity is None:
+            entity = _make_entity(node_dict)
+            all_nodes_dict[key] = entity
+        return entity
 
     # Collect all nodes (use dict to avoid duplicates)
-    root_id = _get_entity_id(root_entity)
-    all_nodes_dict = {root_id: root_entity}
+    all_nodes_dict = {_node_key(root_node_dict): root_entity}
 
     # Build relationships: only direct connections to/from queried entity
     relationships = []
 
     # Process upstream entities and build relationships
     for record in upstream_res:
-        upstream_dict = record.data()["upstream"]
-        upstream_entity = _ensure_entity(upstream_dict)
-        upstream_id = _get_entity_id(upstream_entity)
-        all_nodes_dict[upstream_id] = upstream_entity
-        rel_type = record.data()["rel_type"]
+        row = record.data()
+        upstream_entity = _get_or_make_entity(row["upstream"])
         relationships.append(
             HFRelationship(
                 source=root_entity,
-                relationship=rel_type,
+                relationship=row["rel_type"],
                 target=upstream_entity,
             )
         )
 
     # Process downstream entities and build relationships
     for record in downstream_res:
-        downstream_dict = record.data()["downstream"]
-        downstream_entity = _ensure_entity(downstream_dict)
-        downstream_id = _get_entity_id(downstream_entity)
-        all_nodes_dict[downstream_id] = downstream_entity
-        rel_type = record.data()["rel_type"]
+        row = record.data()
+        downstream_entity = _get_or_make_entity(row["downstream"])
         relationships.append(
             HFRelationship(
                 source=downstream_entity,
-                relationship=rel_type,
+                relationship=row["rel_type"],
                 target=root_entity,
             )
         )
 
     all_nodes = list(all_nodes_dict.values())
 
-    # Count relationships (using entity ID getter)
-    upstream_count = sum(
-        1 for r in relationships if _get_entity_id(r.source) == model_id
-    )
-    downstream_count = sum(
-        1 for r in relationships if _get_entity_id(r.target) == model_id
-    )
+    # Each upstream/downstream record yields exactly one relationship
+    upstream_count = len(upstream_res)
+    downstream_count = len(downstream_res)
 
     entity_type = "dataset" if is_dataset else "model"
     logger.info(
@@ -128,14 +128,10 @@ class TestSearchQueryImpl:
     @patch("routers.search.utils.search_neo4j.set_tool_result")
     def test_search_dataset_found(self, mock_set_tool_result, mock_driver):
         """Test searching for a dataset that exists."""
-        # Mock root dataset query (model query returns empty)
+        # Mock root query matching only the Dataset branch
         mock_root_record = Mock()
         mock_root_record.data.return_value = {"root": {"dataset_id": "test/dataset"}}
 
-        mock_model_summary = Mock()
-        mock_model_summary.query = "model query"
-        mock_model_summary.result_available_after = 5
-
         mock_dataset_summary = Mock()
         mock_dataset_summary.query = "dataset query"
         mock_dataset_summary.result_available_after = 5
@@ -149,8 +145,7 @@ class TestSearchQueryImpl:
         mock_downstream_summary.result_available_after = 5
 
         mock_driver.execute_query.side_effect = [
-            ([], mock_model_summary, None),  # Model query (empty)
-            ([mock_root_record], mock_dataset_summary, None),  # Dataset query
+            ([mock_root_record], mock_dataset_summary, None),  # Root query
             ([], mock_upstream_summary, None),  # Upstream query
             ([], mock_downstream_summary, None),  # Downstream query
         ]
@@ -159,27 +154,25 @@ class TestSearchQueryImpl:
         assert isinstance(result, HFGraphData)
         assert result.queried_model_id == "test/dataset"
         assert len(result.nodes.nodes) == 1
+        assert isinstance(result.nodes.nodes[0], HFDataset)
+        assert mock_driver.execute_query.call_count == 3
 
     @patch("routers.search.utils.search_neo4j.driver")
     def test_search_not_found(self, mock_driver):
         """Test searching for entity that doesn't exist."""
-        mock_model_summary = Mock()
-        mock_model_summary.query = "model query"
-        mock_model_summary.result_available_after = 5
-
-        mock_dataset_summary = Mock()
-        mock_dataset_summary.query = "dataset query"
-        mock_dataset_summary.result_available_after = 5
+        mock_root_summary = Mock()
+        mock_root_summary.query = "root query"
+        mock_root_summary.result_available_after = 5
 
         mock_driver.execute_query.side_effect = [
-            ([], mock_model_summary, None),  # Model query (empty)
-            ([], mock_dataset_summary, None),  # Dataset query (empty)
+            ([], mock_root_summary, None),  # Root query (empty)
         ]
 
         result = search_query_impl("nonexistent/entity")
         assert isinstance(result, HFGraphData)
         assert len(result.nodes.nodes) == 0
         assert len(result.relationships.relationships) == 0
+        mock_driver.execute_query.assert_called_once()
 
     @patch("routers.search.utils.search_neo4j.driver")
     @patch("routers.search.utils.search_neo4j.set_tool_result")
@@ -293,3 +286,76 @@ class TestSearchQueryImpl:
         result = search_query_impl("test/model")
         # Should have root + up to 10 upstream = 11 nodes max
         assert len(result.nodes.nodes) <= 11
+
+    @patch("routers.search.utils.search_neo4j.driver")
+    @patch("routers.search.utils.search_neo4j.set_tool_result")
+    def test_search_reuses_shared_neighbour(self, mock_set_tool_result, mock_driver):
+        """Test that a node seen upstream and downstream is built only once."""
+        mock_root_record = Mock()
+        mock_root_record.data.return_value = {
+            "root": {"model_id": "test/model", "downloads": 1000}
+        }
+
+        shared = {"model_id": "shared/model", "downloads": 500}
+        mock_upstream_record = Mock()
+        mock_upstream_record.data.return_value = {
+            "upstream": shared,
+            "rel_type": "BASED_ON",
+        }
+        mock_downstream_record = Mock()
+        mock_downstream_record.data.return_value = {
+            "downstream": shared,
+            "rel_type": "MERGES",
+        }
+
+        mock_summary = Mock()
+        mock_summary.query = "query"
+        mock_summary.result_available_after = 5
+
+        mock_driver.execute_query.side_effect = [
+            ([mock_root_record], mock_summary, None),  # Root query
+            ([mock_upstream_record], mock_summary, None),  # Upstream query
+            ([mock_downstream_record], mock_summary, None),  # Downstream query
+        ]
+
+        result = search_query_impl("test/model")
+        assert len(result.nodes.nodes) == 2
+        upstream_rel, downstream_rel = result.relationships.relationships
+        assert upstream_rel.target is downstream_rel.source
+
+    @patch("routers.search.utils.search_neo4j.driver")
+    @patch("routers.search.utils.search_neo4j.set_tool_result")
+    def test_search_keeps_dataset_sharing_model_id(
+        self, mock_set_tool_result, mock_driver
+    ):
+        """Test that a dataset with the root model's ID stays a separate node."""
+        mock_root_record = Mock()
+        mock_root_record.data.return_value = {
+            "root": {"model_id": "org/foo", "downloads": 1000}
+        }
+
+        mock_upstream_record = Mock()
+        mock_upstream_record.data.return_value = {
+            "upstream": {"dataset_id": "org/foo"},
+            "rel_type": "TRAINED_ON",
+        }
+
+        mock_summary = Mock()
+        mock_summary.query = "query"
+        mock_summary.result_available_after = 5
+
+        mock_driver.execute_query.side_effect = [
+            ([mock_root_record], mock_summary, None),  # Root query
+            ([mock_upstream_record], mock_summary, None),  # Upstream query
+            ([], mock_summary, None),  # Downstream query
+        ]
+
+        result = search_query_impl("org/foo")
+        assert len(result.nodes.nodes) == 2
+        assert isinstance(result.nodes.nodes[0], HFModel)
+        assert isinstance(result.nodes.nodes[1], HFDataset)
+        rel = result.relationships.relationships[0]
+        assert isinstance(rel.source, HFModel)
+        assert rel.relationship == "TRAINED_ON"
+        assert isinstance(rel.target, HFDataset)
+        assert rel.target.dataset_id == "org/foo"
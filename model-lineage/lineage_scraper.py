@@ -62,17 +62,17 @@ def scrape_models(
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
     # Save with DVC
-    models_path = data_store.save_scraped_models(models, timestamp)
-    datasets_path = data_store.save_scraped_datasets(datasets, timestamp)
-    relationships_path = data_store.save_relationships(relationships, timestamp)
-    metadata_path = data_store.save_metadata(
-        {
+    models_path, datasets_path, relationships_path, metadata_path = data_store.save_all(
+        models=models,
+        datasets=datasets,
+        relationships=relationships,
+        metadata={
             "total_models": len(models),
             "total_datasets": len(datasets),
             "total_relationships": len(relationships),
             "scrape_timestamp": timestamp,
         },
-        timestamp,
+        timestamp=timestamp,
     )
 
     # Clean up old files if keep_latest is specified
@@ -1,10 +1,12 @@
 """Data storage with DVC versioning for lineage scraping pipeline."""
 
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 from config.settings import settings
@@ -23,6 +25,9 @@ class DVCDataStore:
         self.raw_path = self.base_path / "raw"
         self.processed_path = self.base_path / "processed"
 
+        # Parsed JSON keyed by (path, mtime_ns) so repeated loads skip disk reads
+        self._cache: Dict[str, Tuple[str, int, Any]] = {}
+
         # Create directories
         self.raw_path.mkdir(parents=True, exist_ok=True)
         self.processed_path.mkdir(parents=True, exist_ok=True)
@@ -102,6 +107,7 @@ class DVCDataStore:
         data_type: str,
         subdirectory: str,
         timestamp: Optional[str] = None,
+        track: bool = True,
     ) -> str:
         """
         Generic method to save data with DVC tracking.
@@ -111,6 +117,7 @@ class DVCDataStore:
             data_type: Type of data (e.g., "models", "datasets")
             subdirectory: Subdirectory name (e.g., "models", "datasets")
             timestamp: Optional timestamp string
+            track: Whether to run `dvc add` on the saved file
 
         Returns:
             Path to saved file
@@ -125,25 +132,35 @@ class DVCDataStore:
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2)
 
-        self._dvc_add(filepath)
+        if track:
+            self._dvc_add(filepath)
 
         logger.info(f"Saved {len(data)} {data_type} to {filepath}")
         return str(filepath)
 
     def save_scraped_models(
-        self, models: List[Dict[str, Any]], timestamp: Optional[str] = None
+        self,
+        models: List[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+        track: bool = True,
     ) -> str:
         """Save scraped model data with DVC tracking."""
-        return self._save_data(models, "models", "models", timestamp)
+        return self._save_data(models, "models", "models", timestamp, track)
 
     def save_scraped_datasets(
-        self, datasets: List[Dict[str, Any]], timestamp: Optional[str] = None
+        self,
+        datasets: List[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+        track: bool = True,
     ) -> str:
         """Save scraped dataset data with DVC tracking."""
-        return self._save_data(datasets, "datasets", "datasets", timestamp)
+        return self._save_data(datasets, "datasets", "datasets", timestamp, track)
 
     def save_relationships(
-        self, relationships: List[Dict[str, Any]], timestamp: Optional[str] = None
+        self,
+        relationships: List[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+        track: bool = True,
     ) -> str:
         """
         Save relationships with DVC tracking.
@@ -152,7 +169,7 @@ class DVCDataStore:
         # Filter relationships to only include allowed types
         relationships = self.filter_relationships(relationships)
         return self._save_data(
-            relationships, "relationships", "relationships", timestamp
+            relationships, "relationships", "relationships", timestamp, track
         )
 
     def filter_relationships(
@@ -191,7 +208,10 @@ class DVCDataStore:
         return filtered
 
     def save_metadata(
-        self, metadata: Dict[str, Any], timestamp: Optional[str] = None
+        self,
+        metadata: Dict[str, Any],
+        timestamp: Optional[str] = None,
+        track: bool = True,
     ) -> str:
         """Save scraping metadata."""
         if timestamp is None:
@@ -205,15 +225,60 @@ class DVCDataStore:
         with open(filepath, "w") as f:
             json.dump(metadata, f, indent=2)
 
-        self._dvc_add(filepath)
+        if track:
+            self._dvc_add(filepath)
         return str(filepath)
 
+    def save_all(
+        self,
+        *,
+        models: List[Dict[str, Any]],
+        datasets: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]],
+        metadata: Dict[str, Any],
+        timestamp: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Save models, datasets, relationships and metadata concurrently.
+
+        The four files are written in parallel threads and then added to DVC
+        with a single `dvc add` once all writes have finished.
+
+        Returns:
+            Paths to the saved models, datasets, relationships and metadata files
+        """
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(
+                    self.save_scraped_models, models, timestamp, track=False
+                ),
+                executor.submit(
+                    self.save_scraped_datasets, datasets, timestamp, track=False
+                ),
+                executor.submit(
+                    self.save_relationships, relationships, timestamp, track=False
+                ),
+                executor.submit(self.save_metadata, metadata, timestamp, track=False),
+            ]
+            paths = [future.result() for future in futures]
+
+        self._dvc_add(*paths)
+        return paths
+
     def _load_latest_file(
         self, subdirectory: str, pattern: str
     ) -> Optional[List[Dict[str, Any]]]:
         """
         Generic method to load the most recent file matching a pattern.
 
+        Parsed data is cached per subdirectory together with the path and
+        mtime it was read from, so repeated loads of an unchanged file return
+        the same object without re-reading it, and a newer file replaces the
+        cached entry.
+
         Args:
             subdirectory: Subdirectory to search in
             pattern: File pattern to match (e.g., "models_*.json")
@@ -230,77 +295,109 @@ class DVCDataStore:
             return None
 
         latest_file = files[0]
-        with open(latest_file, "r") as f:
-            return json.load(f)
+        path = str(latest_file)
+        mtime_ns = os.stat(latest_file).st_mtime_ns
+        cached = self._cache.get(subdirectory)
+        if cached is not None and cached[:2] == (path, mtime_ns):
+            return cached[2]
+
+        data = json.loads(latest_file.read_bytes())
+        self._cache[subdirectory] = (path, mtime_ns, data)
+        return data
+
+    def invalidate_cache(self):
+        """Drop all cached file contents loaded by _load_latest_file."""
+        self._cache.clear()
 
     def load_latest_models(self) -> Optional[List[Dict[str, Any]]]:
-        """Load the most recent models file."""
+        """Load the most recent models file.
+
+        The returned list is cached and shared between callers; do not mutate it.
+        """
         return self._load_latest_file("models", "models_*.json")
 
     def load_latest_relationships(self) -> Optional[List[Dict[str, Any]]]:
-        """Load the most recent relationships file."""
+        """Load the most recent relationships file.
+
+        The returned list is cached and shared between callers; do not mutate it.
+        """
         return self._load_latest_file("relationships", "relationships_*.json")
 
-    def _dvc_add(self, filepath: Path):
-        """Add file to DVC tracking."""
+    def _dvc_relative_path(self, filepath: Path, project_root: Path) -> Optional[Path]:
+        """Map a data file to its path relative to the project root."""
+        # Get relative path from project root
         try:
-            # Resolve to absolute path first
-            filepath = Path(filepath).resolve()
+            rel_path = filepath.relative_to(project_root)
+        except ValueError:
+            # If filepath is not relative to project_root, handle Docker paths
+            # In Docker, data is mounted at /app/data/model-lineage
+            # but project root is at /workspace
+            filepath_str = str(filepath)
+
+            # Check if we're in Docker (/app) and project root is at /workspace
+            if filepath_str.startswith("/app/data/"):
+                # Convert /app/data/model-lineage/... to data/model-lineage/...
+                rel_path = Path(filepath_str[5:])  # Remove "/app"
+            elif filepath_str.startswith("/app/"):
+                # For other /app paths, try to map to workspace
+                # /app/... should map to workspace/model-lineage/...
+                rel_path = Path("model-lineage") / filepath_str[5:]
+            elif "data/model-lineage" in filepath_str:
+                # Extract the data/model-lineage part
+                idx = filepath_str.find("data/model-lineage")
+                rel_path = Path(filepath_str[idx:])
+            else:
+                logger.warning(f"Could not determine relative path for {filepath}")
+                return None  # Skip DVC add if we can't determine relative path
+
+        # Verify the file exists at the relative path in project root
+        full_path_in_project = project_root / rel_path
+        if not full_path_in_project.exists():
+            logger.warning(
+                f"File {rel_path} does not exist in project root {project_root}. Skipping DVC add."
+            )
+            return None
+
+        return rel_path
 
+    def _dvc_add(self, *filepaths: Path):
+        """Add one or more files to DVC tracking with a single `dvc add` call."""
+        try:
             # Find project root
             project_root = self._find_project_root()
             if project_root is None:
                 logger.warning("Could not find Git repository. Skipping DVC tracking.")
                 return
 
-            # Get relative path from project root
-            try:
-                rel_path = filepath.relative_to(project_root)
-            except ValueError:
-                # If filepath is not relative to project_root, handle Docker paths
-                # In Docker, data is mounted at /app/data/model-lineage
-                # but project root is at /workspace
-                filepath_str = str(filepath)
-
-                # Check if we're in Docker (/app) and project root is at /workspace
-                if filepath_str.startswith("/app/data/"):
-                    # Convert /app/data/model-lineage/... to data/model-lineage/...
-                    rel_path = Path(filepath_str[5:])  # Remove "/app"
-                elif filepath_str.startswith("/app/"):
-                    # For other /app paths, try to map to workspace
-                    # /app/... should map to workspace/model-lineage/...
-                    rel_path = Path("model-lineage") / filepath_str[5:]
-                elif "data/model-lineage" in filepath_str:
-                    # Extract the data/model-lineage part
-                    idx = filepath_str.find("data/model-lineage")
-                    rel_path = Path(filepath_str[idx:])
-                else:
-                    logger.warning(f"Could not determine relative path for {filepath}")
-                    return  # Skip DVC add if we can't determine relative path
-
-            # Verify the file exists at the relative path in project root
-            full_path_in_project = project_root / rel_path
-            if not full_path_in_project.exists():
-                logger.warning(
-                    f"File {rel_path} does not exist in project root {project_root}. Skipping DVC add."
+            # Resolve to absolute paths first
+            rel_paths = []
+            for filepath in filepaths:
+                rel_path = self._dvc_relative_path(
+                    Path(filepath).resolve(), project_root
                 )
+                if rel_path is not None:
+                    rel_paths.append(str(rel_path))
+
+            if not rel_paths:
                 return
 
             # Run dvc add from project root
             subprocess.run(
-                ["dvc", "add", str(rel_path)],
+                ["dvc", "add", *rel_paths],
                 cwd=project_root,
                 capture_output=True,
                 text=True,
                 check=True,
             )
-            logger.info(f"Added {rel_path} to DVC")
+            logger.info(f"Added {', '.join(rel_paths)} to DVC")
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to add {filepath} to DVC: {e.stderr}")
+            logger.error(
+                f"Failed to add {', '.join(map(str, filepaths))} to DVC: {e.stderr}"
+            )
             # Don't raise - allow pipeline to continue even if DVC fails
             logger.warning("Continuing without DVC tracking")
         except Exception as e:
-            logger.error(f"Error in _dvc_add for {filepath}: {e}")
+            logger.error(f"Error in _dvc_add for {', '.join(map(str, filepaths))}: {e}")
             logger.warning("Continuing without DVC tracking")
 
     def commit_version(self, message: Optional[str] = None):
@@ -308,6 +405,8 @@ class DVCDataStore:
         if message is None:
             message = f"Lineage data update: {datetime.now().isoformat()}"
 
+        self.invalidate_cache()
+
         try:
             # Find project root
             project_root = self._find_project_root()
@@ -359,19 +458,19 @@ class DVCDataStore:
             )
             return
 
-        # Determine directory and file pattern based on file_type
+        # Determine directory and filename prefix based on file_type
         if file_type == "models":
             directory = self.raw_path / "models"
-            pattern = "models_*.json"
+            prefix = "models_"
         elif file_type == "datasets":
             directory = self.raw_path / "datasets"
-            pattern = "datasets_*.json"
+            prefix = "datasets_"
         elif file_type == "relationships":
             directory = self.raw_path / "relationships"
-            pattern = "relationships_*.json"
+            prefix = "relationships_"
         elif file_type == "metadata":
             directory = self.raw_path / "metadata"
-            pattern = "scrape_metadata_*.json"
+            prefix = "scrape_metadata_"
         else:
             logger.error(f"Unknown file_type: {file_type}")
             return
@@ -380,8 +479,14 @@ class DVCDataStore:
             logger.debug(f"Directory {directory} does not exist. Nothing to clean.")
             return
 
-        # Find all matching files
-        files = list(directory.glob(pattern))
+        # Filenames embed a YYYY-MM-DD_HH-MM-SS timestamp, so sorting by name
+        # orders files oldest to newest without a stat() call per file
+        with os.scandir(directory) as it:
+            files = sorted(
+                (entry.name, entry.path)
+                for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+            )
 
         if len(files) <= keep_latest:
             logger.debug(
@@ -389,27 +494,29 @@ class DVCDataStore:
             )
             return
 
-        # Sort by modification time (most recent first)
-        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-        # Files to keep (most recent N)
-        files_to_delete = files[keep_latest:]
-
         deleted_count = 0
-        for filepath in files_to_delete:
+        # Work on the DirEntry path strings directly; everything except the
+        # most recent N is deleted
+        for name, path in files[:-keep_latest]:
             try:
                 # Delete the data file
-                filepath.unlink()
+                os.unlink(path)
                 deleted_count += 1
-                logger.debug(f"Deleted old file: {filepath.name}")
+                logger.debug(f"Deleted old file: {name}")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"Failed to delete {path}: {e}")
+                continue
 
-                # Also delete corresponding .dvc file if it exists
-                dvc_file = filepath.with_suffix(filepath.suffix + ".dvc")
-                if dvc_file.exists():
-                    dvc_file.unlink()
-                    logger.debug(f"Deleted old DVC file: {dvc_file.name}")
+            # Also delete corresponding .dvc file if it exists
+            try:
+                os.unlink(path + ".dvc")
+                logger.debug(f"Deleted old DVC file: {name}.dvc")
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.error(f"Failed to delete {filepath}: {e}")
+                logger.error(f"Failed to delete {path}.dvc: {e}")
 
         if deleted_count > 0:
             logger.info(
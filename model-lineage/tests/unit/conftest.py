@@ -0,0 +1,91 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+
+# Attributes the scraper reads from huggingface_hub ModelInfo / DatasetInfo
+MODEL_INFO_ATTRS = [
+    "id",
+    "author",
+    "downloads",
+    "likes",
+    "tags",
+    "pipeline_tag",
+    "library_name",
+    "private",
+    "created_at",
+    "updated_at",
+    "last_modified",
+    "sha",
+]
+DATASET_INFO_ATTRS = [
+    "id",
+    "author",
+    "downloads",
+    "tags",
+    "created_at",
+    "updated_at",
+]
+
+
+def _mock_factory(spec_set, defaults):
+    """Return a factory producing copies of one canonical mock with overrides.
+
+    Mutable defaults (e.g. tags lists) are deep-copied per call so that a test
+    mutating them cannot leak into later copies.
+    """
+    canonical = Mock(spec_set=spec_set, **defaults)
+    mutable = {
+        name: value
+        for name, value in defaults.items()
+        if isinstance(value, (list, dict, set))
+    }
+
+    def factory(**overrides):
+        mock = copy.copy(canonical)
+        mock.configure_mock(**{**copy.deepcopy(mutable), **overrides})
+        return mock
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def make_model_info():
+    """Build mock ModelInfo objects from one canonical mock per module."""
+    return _mock_factory(
+        MODEL_INFO_ATTRS,
+        {
+            "id": "test/model",
+            "author": "test_author",
+            "downloads": 1000,
+            "likes": 50,
+            "tags": ["nlp", "bert"],
+            "pipeline_tag": "text-classification",
+            "library_name": "transformers",
+            "private": False,
+            "created_at": None,
+            "updated_at": None,
+            "last_modified": None,
+            "sha": "abc123",
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def make_dataset_info():
+    """Build mock DatasetInfo objects from one canonical mock per module."""
+    return _mock_factory(
+        DATASET_INFO_ATTRS,
+        {
+            "id": "author/dataset",
+            "author": "author",
+            "downloads": 1000,
+            "tags": [],
+            "created_at": None,
+            "updated_at": None,
+        },
+    )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import subprocess
-import tempfile
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -13,11 +15,28 @@ import pytest
 from storage.data_store import DVCDataStore
 
 
+def _count(directory, prefix):
+    """Count the JSON files in a directory whose names start with prefix."""
+    return sum(
+        1
+        for name in os.listdir(directory)
+        if name.startswith(prefix) and name.endswith(".json")
+    )
+
+
+def _seed(directory, prefix, n):
+    """Create n timestamped JSON files whose mtimes follow their name order."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(n):
+        path = directory / f"{prefix}_2024-01-{i + 1:02d}_00-00-00.json"
+        path.write_bytes(b"{}")
+        os.utime(path, (i, i))
+
+
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -28,122 +47,204 @@ def mock_project_root(temp_dir):
     return temp_dir
 
 
-def test_dvc_data_store_init(temp_dir):
-    """Test DVCDataStore initialization."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+@pytest.fixture
+def mocked_store(temp_dir, mock_project_root):
+    """Create a store rooted at mock_project_root with subprocess calls mocked."""
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(
+                DVCDataStore, "_find_project_root", return_value=mock_project_root
+            )
+        )
+        mock_subprocess = stack.enter_context(
+            patch("storage.data_store.subprocess.run")
+        )
+        yield DVCDataStore(base_path=temp_dir), mock_subprocess, mock_project_root
 
-        store = DVCDataStore(base_path=temp_dir)
 
-        assert store.base_path == temp_dir
-        assert store.raw_path == temp_dir / "raw"
-        assert store.processed_path == temp_dir / "processed"
-        assert store.raw_path.exists()
-        assert store.processed_path.exists()
+@pytest.fixture(autouse=True)
+def _patch_settings(temp_dir, monkeypatch):
+    """Point the data store settings at the test's temporary directory."""
+    import storage.data_store as ds
 
+    monkeypatch.setattr(ds.settings, "BASE_DATA_PATH", temp_dir, raising=False)
 
-def test_save_scraped_models(temp_dir):
-    """Test saving scraped models."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
 
-        store = DVCDataStore(base_path=temp_dir)
+@pytest.fixture(scope="module")
+def shared_store(tmp_path_factory):
+    """Create a single DVCDataStore shared by the tests in this module."""
+    return DVCDataStore(base_path=tmp_path_factory.mktemp("dvc_store"))
 
-        models = [
-            {"model_id": "model1", "author": "author1"},
-            {"model_id": "model2", "author": "author2"},
-        ]
 
-        filepath_str = store.save_scraped_models(
-            models, timestamp="2024-01-01_00-00-00"
-        )
-        filepath = Path(filepath_str)
+@pytest.fixture
+def store(shared_store):
+    """Provide the shared store and clear its raw data after each test."""
+    yield shared_store
+    shared_store.invalidate_cache()
+    for subdirectory in shared_store.raw_path.iterdir():
+        if subdirectory.is_dir():
+            shutil.rmtree(subdirectory)
 
-        assert filepath.exists()
-        assert filepath.name == "models_2024-01-01_00-00-00.json"
 
-        # Verify content
-        with open(filepath) as f:
-            data = json.load(f)
-            assert len(data) == 2
-            assert data[0]["model_id"] == "model1"
+def test_dvc_data_store_init(temp_dir):
+    """Test DVCDataStore initialization."""
+    store = DVCDataStore(base_path=temp_dir)
 
+    assert store.base_path == temp_dir
+    assert store.raw_path == temp_dir / "raw"
+    assert store.processed_path == temp_dir / "processed"
+    assert store.raw_path.exists()
+    assert store.processed_path.exists()
 
-def test_save_scraped_datasets(temp_dir):
-    """Test saving scraped datasets."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
 
-        store = DVCDataStore(base_path=temp_dir)
+def test_save_scraped_models(store):
+    """Test saving scraped models."""
+    models = [
+        {"model_id": "model1", "author": "author1"},
+        {"model_id": "model2", "author": "author2"},
+    ]
 
-        datasets = [
-            {"dataset_id": "dataset1", "author": "author1"},
-            {"dataset_id": "dataset2", "author": "author2"},
-        ]
+    filepath_str = store.save_scraped_models(models, timestamp="2024-01-01_00-00-00")
+    filepath = Path(filepath_str)
 
-        filepath_str = store.save_scraped_datasets(
-            datasets, timestamp="2024-01-01_00-00-00"
-        )
-        filepath = Path(filepath_str)
+    assert filepath.exists()
+    assert filepath.name == "models_2024-01-01_00-00-00.json"
 
-        assert filepath.exists()
-        assert filepath.name == "datasets_2024-01-01_00-00-00.json"
+    # Verify content
+    with open(filepath) as f:
+        data = json.load(f)
+        assert len(data) == 2
+        assert data[0]["model_id"] == "model1"
 
-        with open(filepath) as f:
-            data = json.load(f)
-            assert len(data) == 2
-            assert data[0]["dataset_id"] == "dataset1"
 
+def test_save_scraped_datasets(store):
+    """Test saving scraped datasets."""
+    datasets = [
+        {"dataset_id": "dataset1", "author": "author1"},
+        {"dataset_id": "dataset2", "author": "author2"},
+    ]
 
-def test_save_relationships(temp_dir):
-    """Test saving relationships."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    filepath_str = store.save_scraped_datasets(
+        datasets, timestamp="2024-01-01_00-00-00"
+    )
+    filepath = Path(filepath_str)
 
-        store = DVCDataStore(base_path=temp_dir)
+    assert filepath.exists()
+    assert filepath.name == "datasets_2024-01-01_00-00-00.json"
 
-        relationships = [
-            {
-                "source": "model1",
-                "target": "model2",
-                "relationship_type": "finetuned",
-                "source_type": "model",
-                "target_type": "model",
-            }
-        ]
-
-        filepath_str = store.save_relationships(
-            relationships, timestamp="2024-01-01_00-00-00"
-        )
-        filepath = Path(filepath_str)
-
-        assert filepath.exists()
-        assert filepath.name == "relationships_2024-01-01_00-00-00.json"
+    with open(filepath) as f:
+        data = json.load(f)
+        assert len(data) == 2
+        assert data[0]["dataset_id"] == "dataset1"
 
-        with open(filepath) as f:
-            data = json.load(f)
-            assert len(data) == 1
-            assert data[0]["source"] == "model1"
 
+def test_save_relationships(store):
+    """Test saving relationships."""
+    relationships = [
+        {
+            "source": "model1",
+            "target": "model2",
+            "relationship_type": "finetuned",
+            "source_type": "model",
+            "target_type": "model",
+        }
+    ]
+
+    filepath_str = store.save_relationships(
+        relationships, timestamp="2024-01-01_00-00-00"
+    )
+    filepath = Path(filepath_str)
+
+    assert filepath.exists()
+    assert filepath.name == "relationships_2024-01-01_00-00-00.json"
+
+    with open(filepath) as f:
+        data = json.load(f)
+        assert len(data) == 1
+        assert data[0]["source"] == "model1"
+
+
+def test_save_all(store):
+    """Test saving every category at once with a single DVC add."""
+    with patch.object(store, "_dvc_add") as mock_dvc_add:
+        paths = store.save_all(
+            models=[{"model_id": "model1"}],
+            datasets=[{"dataset_id": "dataset1"}],
+            relationships=[
+                {"source": "model1", "target": "model2", "relationship_type": "merges"}
+            ],
+            metadata={"total_models": 1},
+            timestamp="2024-01-01_00-00-00",
+        )
 
-@patch("storage.data_store.subprocess.run")
-def test_dvc_add_called_on_save(mock_subprocess, temp_dir, mock_project_root):
+    assert [Path(p).name for p in paths] == [
+        "models_2024-01-01_00-00-00.json",
+        "datasets_2024-01-01_00-00-00.json",
+        "relationships_2024-01-01_00-00-00.json",
+        "scrape_metadata_2024-01-01_00-00-00.json",
+    ]
+    assert all(Path(p).exists() for p in paths)
+    mock_dvc_add.assert_called_once_with(*paths)
+
+
+def _save_all_sample(store):
+    """Save one record of every category and return the written paths."""
+    return store.save_all(
+        models=[{"model_id": "model1"}],
+        datasets=[{"dataset_id": "dataset1"}],
+        relationships=[
+            {"source": "model1", "target": "model2", "relationship_type": "merges"}
+        ],
+        metadata={"total_models": 1},
+        timestamp="2024-01-01_00-00-00",
+    )
+
+
+def test_save_all_single_dvc_add(mocked_store):
+    """Test that save_all tracks every file with one `dvc add` call."""
+    store, mock_subprocess, project_root = mocked_store
+    mock_subprocess.reset_mock()
+
+    paths = _save_all_sample(store)
+
+    mock_subprocess.assert_called_once()
+    assert mock_subprocess.call_args.args[0] == [
+        "dvc",
+        "add",
+        *(str(Path(p).relative_to(project_root)) for p in paths),
+    ]
+    assert mock_subprocess.call_args.kwargs["cwd"] == project_root
+
+
+def test_dvc_add_skips_unmapped_path(mocked_store, tmp_path_factory):
+    """Test that a path outside the project is skipped while others are added."""
+    store, mock_subprocess, project_root = mocked_store
+    paths = _save_all_sample(store)
+    outside = tmp_path_factory.mktemp("outside") / "stray.json"
+    outside.write_text("{}")
+    mock_subprocess.reset_mock()
+
+    store._dvc_add(paths[0], outside, paths[1])
+
+    mock_subprocess.assert_called_once()
+    assert mock_subprocess.call_args.args[0] == [
+        "dvc",
+        "add",
+        str(Path(paths[0]).relative_to(project_root)),
+        str(Path(paths[1]).relative_to(project_root)),
+    ]
+
+
+def test_dvc_add_called_on_save(mocked_store):
     """Test that DVC add is called when saving files."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        with patch.object(
-            DVCDataStore, "_find_project_root", return_value=mock_project_root
-        ):
-            store = DVCDataStore(base_path=temp_dir)
+    store, mock_subprocess, _ = mocked_store
 
-            models = [{"model_id": "model1"}]
-            filepath_str = store.save_scraped_models(models)
-            filepath = Path(filepath_str)
+    models = [{"model_id": "model1"}]
+    filepath_str = store.save_scraped_models(models)
+    filepath = Path(filepath_str)
 
-            # Verify dvc add was called (if DVC is available)
-            # Note: This may not be called if DVC init fails, which is expected in tests
-            assert filepath.exists()
+    assert filepath.exists()
+    assert mock_subprocess.call_args.args[0][:2] == ["dvc", "add"]
 
 
 def test_find_project_root_with_git(temp_dir):
@@ -169,397 +270,326 @@ def test_find_project_root_with_dvc(temp_dir):
     assert root is not None
 
 
-def test_save_metadata(temp_dir):
+def test_save_metadata(store):
     """Test saving metadata."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    metadata = {"total_models": 100, "total_datasets": 50}
 
-        store = DVCDataStore(base_path=temp_dir)
-
-        metadata = {"total_models": 100, "total_datasets": 50}
-
-        filepath_str = store.save_metadata(metadata, timestamp="2024-01-01_00-00-00")
-        filepath = Path(filepath_str)
+    filepath_str = store.save_metadata(metadata, timestamp="2024-01-01_00-00-00")
+    filepath = Path(filepath_str)
 
-        assert filepath.exists()
-        assert filepath.name == "scrape_metadata_2024-01-01_00-00-00.json"
+    assert filepath.exists()
+    assert filepath.name == "scrape_metadata_2024-01-01_00-00-00.json"
 
-        with open(filepath) as f:
-            data = json.load(f)
-            assert data["total_models"] == 100
-            assert data["timestamp"] == "2024-01-01_00-00-00"
+    with open(filepath) as f:
+        data = json.load(f)
+        assert data["total_models"] == 100
+        assert data["timestamp"] == "2024-01-01_00-00-00"
 
 
 def test_load_latest_models(temp_dir):
     """Test loading latest models file."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    store = DVCDataStore(base_path=temp_dir)
 
-        store = DVCDataStore(base_path=temp_dir)
+    # Create models directory and files
+    models_dir = store.raw_path / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create older file
+    older_file = models_dir / "models_2024-01-01_00-00-00.json"
+    with open(older_file, "w") as f:
+        json.dump([{"model_id": "old_model"}], f)
+
+    # Create newer file
+    newer_file = models_dir / "models_2024-01-02_00-00-00.json"
+    with open(newer_file, "w") as f:
+        json.dump([{"model_id": "new_model"}], f)
 
-        # Create models directory and files
-        models_dir = store.raw_path / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
+    models = store.load_latest_models()
 
-        # Create older file
-        older_file = models_dir / "models_2024-01-01_00-00-00.json"
-        with open(older_file, "w") as f:
-            json.dump([{"model_id": "old_model"}], f)
+    assert models is not None
+    assert len(models) == 1
+    assert models[0]["model_id"] == "new_model"
 
-        # Create newer file
-        newer_file = models_dir / "models_2024-01-02_00-00-00.json"
-        with open(newer_file, "w") as f:
-            json.dump([{"model_id": "new_model"}], f)
 
-        models = store.load_latest_models()
+def test_load_latest_cached(store):
+    """Test that repeated loads of an unchanged file reuse the parsed data."""
+    store.save_scraped_models(
+        [{"model_id": "cached_model"}], timestamp="2024-01-01_00-00-00"
+    )
 
-        assert models is not None
-        assert len(models) == 1
-        assert models[0]["model_id"] == "new_model"
+    with patch.object(
+        Path, "read_bytes", autospec=True, side_effect=Path.read_bytes
+    ) as mock_read:
+        first = store.load_latest_models()
+        second = store.load_latest_models()
+
+        assert first == [{"model_id": "cached_model"}]
+        assert second is first
+        assert mock_read.call_count == 1
+
+        store.invalidate_cache()
+        store.load_latest_models()
+
+        assert mock_read.call_count == 2
+
+
+def test_load_latest_cache_replaced_by_newer_file(store):
+    """Test that a newer latest file replaces the cached entry."""
+    store.save_scraped_models([{"model_id": "old"}], timestamp="2024-01-01_00-00-00")
+    assert store.load_latest_models() == [{"model_id": "old"}]
+
+    store.save_scraped_models([{"model_id": "new"}], timestamp="2024-01-02_00-00-00")
+    assert store.load_latest_models() == [{"model_id": "new"}]
+
+    assert len(store._cache) == 1
+    assert store._cache["models"][0].endswith("models_2024-01-02_00-00-00.json")
 
 
 def test_load_latest_models_no_files(temp_dir):
     """Test loading latest models when no files exist."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
+    store = DVCDataStore(base_path=temp_dir)
 
-        models = store.load_latest_models()
+    models = store.load_latest_models()
 
-        assert models is None
+    assert models is None
 
 
 def test_load_latest_relationships(temp_dir):
     """Test loading latest relationships file."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
-
-        # Create relationships directory and files
-        rel_dir = store.raw_path / "relationships"
-        rel_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create newer file
-        newer_file = rel_dir / "relationships_2024-01-02_00-00-00.json"
-        with open(newer_file, "w") as f:
-            json.dump(
-                [
-                    {
-                        "source": "model1",
-                        "target": "model2",
-                        "relationship_type": "finetuned",
-                    }
-                ],
-                f,
-            )
+    store = DVCDataStore(base_path=temp_dir)
+
+    # Create relationships directory and files
+    rel_dir = store.raw_path / "relationships"
+    rel_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create newer file
+    newer_file = rel_dir / "relationships_2024-01-02_00-00-00.json"
+    with open(newer_file, "w") as f:
+        json.dump(
+            [
+                {
+                    "source": "model1",
+                    "target": "model2",
+                    "relationship_type": "finetuned",
+                }
+            ],
+            f,
+        )
 
-        relationships = store.load_latest_relationships()
+    relationships = store.load_latest_relationships()
 
-        assert relationships is not None
-        assert len(relationships) == 1
-        assert relationships[0]["source"] == "model1"
+    assert relationships is not None
+    assert len(relationships) == 1
+    assert relationships[0]["source"] == "model1"
 
 
 def test_load_latest_relationships_no_files(temp_dir):
     """Test loading latest relationships when no files exist."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    store = DVCDataStore(base_path=temp_dir)
 
-        store = DVCDataStore(base_path=temp_dir)
-
-        relationships = store.load_latest_relationships()
+    relationships = store.load_latest_relationships()
 
-        assert relationships is None
+    assert relationships is None
 
 
-@patch("storage.data_store.subprocess.run")
-def test_dvc_add_with_project_root(mock_subprocess, temp_dir, mock_project_root):
+def test_dvc_add_with_project_root(mocked_store, temp_dir):
     """Test DVC add when project root is found."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    store, mock_subprocess, _ = mocked_store
 
-        with patch.object(
-            DVCDataStore, "_find_project_root", return_value=mock_project_root
-        ):
-            store = DVCDataStore(base_path=temp_dir)
+    filepath = temp_dir / "raw" / "models" / "test.json"
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    filepath.write_text("{}")
 
-            filepath = temp_dir / "raw" / "models" / "test.json"
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            filepath.write_text("{}")
+    store._dvc_add(filepath)
 
-            store._dvc_add(filepath)
-
-            # Verify dvc add was called
-            assert mock_subprocess.called
+    # Verify dvc add was called
+    assert mock_subprocess.called
 
 
 @patch("storage.data_store.subprocess.run")
 def test_dvc_add_no_project_root(mock_subprocess, temp_dir):
     """Test DVC add when project root is not found."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        with patch.object(DVCDataStore, "_find_project_root", return_value=None):
-            store = DVCDataStore(base_path=temp_dir)
+    with patch.object(DVCDataStore, "_find_project_root", return_value=None):
+        store = DVCDataStore(base_path=temp_dir)
 
-            filepath = temp_dir / "raw" / "models" / "test.json"
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            filepath.write_text("{}")
+        filepath = temp_dir / "raw" / "models" / "test.json"
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text("{}")
 
-            store._dvc_add(filepath)
+        store._dvc_add(filepath)
 
-            # Should not call dvc add if no project root
-            # (may still be called for DVC init, but that's okay)
+        # Should not call dvc add if no project root
+        # (may still be called for DVC init, but that's okay)
 
 
 def test_dvc_data_store_init_with_none_base_path(temp_dir):
     """Test DVCDataStore initialization with base_path=None."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    store = DVCDataStore(base_path=None)
 
-        store = DVCDataStore(base_path=None)
+    assert store.base_path == temp_dir
+    assert store.raw_path == temp_dir / "raw"
+    assert store.processed_path == temp_dir / "processed"
 
-        assert store.base_path == temp_dir
-        assert store.raw_path == temp_dir / "raw"
-        assert store.processed_path == temp_dir / "processed"
 
-
-def test_filter_relationships(temp_dir):
+def test_filter_relationships(store):
     """Test filtering relationships by type."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    relationships = [
+        {"source": "m1", "target": "m2", "relationship_type": "finetuned"},
+        {"source": "m2", "target": "m3", "relationship_type": "adapters"},
+        {"source": "m3", "target": "m4", "relationship_type": "unknown"},
+    ]
 
-        store = DVCDataStore(base_path=temp_dir)
+    filtered = store.filter_relationships(
+        relationships, allowed_types=["finetuned", "adapters"]
+    )
 
-        relationships = [
-            {"source": "m1", "target": "m2", "relationship_type": "finetuned"},
-            {"source": "m2", "target": "m3", "relationship_type": "adapters"},
-            {"source": "m3", "target": "m4", "relationship_type": "unknown"},
-        ]
+    assert len(filtered) == 2
+    assert filtered[0]["relationship_type"] == "finetuned"
+    assert filtered[1]["relationship_type"] == "adapters"
 
-        filtered = store.filter_relationships(
-            relationships, allowed_types=["finetuned", "adapters"]
-        )
 
-        assert len(filtered) == 2
-        assert filtered[0]["relationship_type"] == "finetuned"
-        assert filtered[1]["relationship_type"] == "adapters"
-
-
-def test_filter_relationships_default_types(temp_dir):
+def test_filter_relationships_default_types(store):
     """Test filtering relationships with default allowed types."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
-
-        relationships = [
-            {"source": "m1", "target": "m2", "relationship_type": "finetuned"},
-            {"source": "m2", "target": "m3", "relationship_type": "trained_on"},
-            {"source": "m3", "target": "m4", "relationship_type": "unknown"},
-        ]
+    relationships = [
+        {"source": "m1", "target": "m2", "relationship_type": "finetuned"},
+        {"source": "m2", "target": "m3", "relationship_type": "trained_on"},
+        {"source": "m3", "target": "m4", "relationship_type": "unknown"},
+    ]
 
-        filtered = store.filter_relationships(relationships)
+    filtered = store.filter_relationships(relationships)
 
-        assert len(filtered) == 2
-        assert any(r["relationship_type"] == "finetuned" for r in filtered)
-        assert any(r["relationship_type"] == "trained_on" for r in filtered)
+    assert len(filtered) == 2
+    assert any(r["relationship_type"] == "finetuned" for r in filtered)
+    assert any(r["relationship_type"] == "trained_on" for r in filtered)
 
 
 def test_load_latest_file_no_files(temp_dir):
     """Test _load_latest_file when no files exist."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    store = DVCDataStore(base_path=temp_dir)
 
-        store = DVCDataStore(base_path=temp_dir)
+    result = store._load_latest_file("models", "models_*.json")
 
-        result = store._load_latest_file("models", "models_*.json")
+    assert result is None
 
-        assert result is None
 
-
-def test_dvc_add_docker_paths(temp_dir, mock_project_root):
+def test_dvc_add_docker_paths(mocked_store, temp_dir):
     """Test _dvc_add with Docker path handling."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        with patch.object(
-            DVCDataStore, "_find_project_root", return_value=mock_project_root
-        ):
-            store = DVCDataStore(base_path=temp_dir)
+    store, _, _ = mocked_store
 
-            # Create a file in the temp_dir instead of /app
-            test_file = temp_dir / "raw" / "models" / "test.json"
-            test_file.parent.mkdir(parents=True, exist_ok=True)
-            test_file.write_text("{}")
+    # Create a file in the temp_dir instead of /app
+    test_file = temp_dir / "raw" / "models" / "test.json"
+    test_file.parent.mkdir(parents=True, exist_ok=True)
+    test_file.write_text("{}")
 
-            with patch("storage.data_store.subprocess.run"):
-                # Mock the relative_to to simulate Docker path scenario
-                with patch.object(
-                    Path, "relative_to", side_effect=ValueError("Not relative")
-                ):
-                    store._dvc_add(test_file)
-                    # Should handle Docker paths gracefully
+    # Mock the relative_to to simulate Docker path scenario
+    with patch.object(Path, "relative_to", side_effect=ValueError("Not relative")):
+        store._dvc_add(test_file)
+        # Should handle Docker paths gracefully
 
 
-@patch("storage.data_store.subprocess.run")
-def test_commit_version_success(mock_subprocess, temp_dir, mock_project_root):
+def test_commit_version_success(mocked_store):
     """Test successful version commit."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    store, mock_subprocess, _ = mocked_store
 
-        with patch.object(
-            DVCDataStore, "_find_project_root", return_value=mock_project_root
-        ):
-            store = DVCDataStore(base_path=temp_dir)
+    store.commit_version("Test commit")
 
-            store.commit_version("Test commit")
-
-            # Verify dvc commit and git commands were called
-            assert mock_subprocess.called
+    # Verify dvc commit and git commands were called
+    assert mock_subprocess.called
 
 
 @patch("storage.data_store.subprocess.run")
 def test_commit_version_no_project_root(mock_subprocess, temp_dir):
     """Test commit_version when project root is not found."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        with patch.object(DVCDataStore, "_find_project_root", return_value=None):
-            store = DVCDataStore(base_path=temp_dir)
+    with patch.object(DVCDataStore, "_find_project_root", return_value=None):
+        store = DVCDataStore(base_path=temp_dir)
 
-            store.commit_version("Test commit")
+        store.commit_version("Test commit")
 
-            # Should not call subprocess if no project root
-            # (subprocess may still be called for DVC init, but that's okay)
+        # Should not call subprocess if no project root
+        # (subprocess may still be called for DVC init, but that's okay)
 
 
-@patch("storage.data_store.subprocess.run")
-def test_commit_version_git_commit_fails(mock_subprocess, temp_dir, mock_project_root):
+def test_commit_version_git_commit_fails(mocked_store):
     """Test commit_version when git commit fails."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        with patch.object(
-            DVCDataStore, "_find_project_root", return_value=mock_project_root
-        ):
-            store = DVCDataStore(base_path=temp_dir)
+    store, mock_subprocess, _ = mocked_store
 
-            # Make git commit fail
-            def side_effect(*args, **kwargs):
-                if "git" in args[0] and "commit" in args[0]:
-                    raise subprocess.CalledProcessError(1, "git")
-                return MagicMock()
+    # Make git commit fail
+    def side_effect(*args, **kwargs):
+        if "git" in args[0] and "commit" in args[0]:
+            raise subprocess.CalledProcessError(1, "git")
+        return MagicMock()
 
-            mock_subprocess.side_effect = side_effect
+    mock_subprocess.side_effect = side_effect
 
-            # Should not raise, just log warning
-            store.commit_version("Test commit")
+    # Should not raise, just log warning
+    store.commit_version("Test commit")
 
 
-def test_cleanup_old_files_models(temp_dir):
+def test_cleanup_old_files_models(store):
     """Test cleanup_old_files for models."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
-
-        # Create models directory and multiple files
-        models_dir = store.raw_path / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
+    # Create models directory and 3 files
+    models_dir = store.raw_path / "models"
+    _seed(models_dir, "models", 3)
+    for i in range(3):
+        (models_dir / f"models_2024-01-{i + 1:02d}_00-00-00.json.dvc").touch()
 
-        # Create 3 files
-        for i in range(3):
-            file = models_dir / f"models_2024-01-0{i + 1}_00-00-00.json"
-            file.write_text("{}")
+    store.cleanup_old_files(keep_latest=2, file_type="models")
 
-        store.cleanup_old_files(keep_latest=2, file_type="models")
+    # Should keep 2 most recent files
+    assert _count(models_dir, "models_") == 2
+    assert (models_dir / "models_2024-01-03_00-00-00.json").exists()
+    assert not (models_dir / "models_2024-01-01_00-00-00.json").exists()
 
-        # Should keep 2 most recent files
-        remaining_files = list(models_dir.glob("models_*.json"))
-        assert len(remaining_files) == 2
+    # DVC sidecars follow their data files
+    assert not (models_dir / "models_2024-01-01_00-00-00.json.dvc").exists()
+    assert (models_dir / "models_2024-01-02_00-00-00.json.dvc").exists()
+    assert (models_dir / "models_2024-01-03_00-00-00.json.dvc").exists()
 
 
-def test_cleanup_old_files_relationships(temp_dir):
+def test_cleanup_old_files_relationships(store):
     """Test cleanup_old_files for relationships."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    rel_dir = store.raw_path / "relationships"
+    _seed(rel_dir, "relationships", 3)
 
-        store = DVCDataStore(base_path=temp_dir)
-
-        rel_dir = store.raw_path / "relationships"
-        rel_dir.mkdir(parents=True, exist_ok=True)
-
-        for i in range(3):
-            file = rel_dir / f"relationships_2024-01-0{i + 1}_00-00-00.json"
-            file.write_text("{}")
+    store.cleanup_old_files(keep_latest=1, file_type="relationships")
 
-        store.cleanup_old_files(keep_latest=1, file_type="relationships")
+    assert _count(rel_dir, "relationships_") == 1
+    assert (rel_dir / "relationships_2024-01-03_00-00-00.json").exists()
 
-        remaining_files = list(rel_dir.glob("relationships_*.json"))
-        assert len(remaining_files) == 1
 
-
-def test_cleanup_old_files_metadata(temp_dir):
+def test_cleanup_old_files_metadata(store):
     """Test cleanup_old_files for metadata."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
+    metadata_dir = store.raw_path / "metadata"
+    _seed(metadata_dir, "scrape_metadata", 2)
 
-        metadata_dir = store.raw_path / "metadata"
-        metadata_dir.mkdir(parents=True, exist_ok=True)
+    store.cleanup_old_files(keep_latest=1, file_type="metadata")
 
-        for i in range(2):
-            file = metadata_dir / f"scrape_metadata_2024-01-0{i + 1}_00-00-00.json"
-            file.write_text("{}")
+    assert _count(metadata_dir, "scrape_metadata_") == 1
+    assert (metadata_dir / "scrape_metadata_2024-01-02_00-00-00.json").exists()
 
-        store.cleanup_old_files(keep_latest=1, file_type="metadata")
 
-        remaining_files = list(metadata_dir.glob("scrape_metadata_*.json"))
-        assert len(remaining_files) == 1
-
-
-def test_cleanup_old_files_invalid_type(temp_dir):
+def test_cleanup_old_files_invalid_type(store):
     """Test cleanup_old_files with invalid file type."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
-
-        # Should not raise, just log error
-        store.cleanup_old_files(keep_latest=1, file_type="invalid")
+    # Should not raise, just log error
+    store.cleanup_old_files(keep_latest=1, file_type="invalid")
 
 
-def test_cleanup_old_files_keep_zero(temp_dir):
+def test_cleanup_old_files_keep_zero(store):
     """Test cleanup_old_files with keep_latest=0."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
+    # Should not raise, just log warning
+    store.cleanup_old_files(keep_latest=0, file_type="models")
 
-        store = DVCDataStore(base_path=temp_dir)
 
-        # Should not raise, just log warning
-        store.cleanup_old_files(keep_latest=0, file_type="models")
-
-
-def test_cleanup_old_files_not_enough_files(temp_dir):
+def test_cleanup_old_files_not_enough_files(store):
     """Test cleanup_old_files when there aren't enough files to clean."""
-    with patch("storage.data_store.settings") as mock_settings:
-        mock_settings.BASE_DATA_PATH = temp_dir
-
-        store = DVCDataStore(base_path=temp_dir)
-
-        models_dir = store.raw_path / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
+    models_dir = store.raw_path / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create only 1 file
-        file = models_dir / "models_2024-01-01_00-00-00.json"
-        file.write_text("{}")
+    # Create only 1 file
+    file = models_dir / "models_2024-01-01_00-00-00.json"
+    file.write_text("{}")
 
-        store.cleanup_old_files(keep_latest=2, file_type="models")
+    store.cleanup_old_files(keep_latest=2, file_type="models")
 
-        # Should keep the file
-        remaining_files = list(models_dir.glob("models_*.json"))
-        assert len(remaining_files) == 1
+    # Should keep the file
+    assert _count(models_dir, "models_") == 1
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, MagicMock, patch
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
 import pytest
 
 from scrapers.huggingface_scraper import HuggingFaceScraper
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep():
+    """Skip the scraper's rate-limit delays without touching the global time module."""
+    with patch("scrapers.huggingface_scraper.time"):
+        yield
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Mock settings."""
+    """Mock scraper settings."""
     with patch("scrapers.huggingface_scraper.settings") as mock_settings:
         mock_settings.HF_TOKEN = "test_token"
         mock_settings.RATE_LIMIT_DELAY = 0.1
@@ -18,42 +27,40 @@ def mock_settings():
         yield mock_settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_hf_api():
-    """Mock HuggingFace API."""
+    """Mock HuggingFace API shared by every scraper instance."""
     api = MagicMock()
     with patch("scrapers.huggingface_scraper.HfApi", return_value=api):
         yield api
 
 
-def test_scraper_init(mock_settings, mock_hf_api):
+@pytest.fixture(scope="module")
+def scraper(mock_settings, mock_hf_api):
+    """HuggingFaceScraper built once against the mocked settings and API."""
+    return HuggingFaceScraper()
+
+
+@pytest.fixture(autouse=True)
+def _reset_hf_api(mock_hf_api):
+    """Clear the shared HfApi mock's call history and configuration."""
+    yield
+    mock_hf_api.reset_mock(return_value=True, side_effect=True)
+
+
+def test_scraper_init(scraper, mock_hf_api):
     """Test scraper initialization."""
-    scraper = HuggingFaceScraper()
     assert scraper.api == mock_hf_api
     assert scraper.rate_limit_delay == 0.1
 
 
-def test_extract_model_info(mock_settings, mock_hf_api):
+def test_extract_model_info(scraper, make_model_info):
     """Test extracting model information."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
-    mock_model_info.id = "test/model"
-    mock_model_info.author = "test_author"
-    mock_model_info.downloads = 1000
-    mock_model_info.likes = 50
-    mock_model_info.tags = ["nlp", "bert"]
-    mock_model_info.pipeline_tag = "text-classification"
-    mock_model_info.library_name = "transformers"
-    mock_model_info.private = False
-    mock_created_at = Mock()
-    mock_created_at.isoformat.return_value = "2024-01-01T00:00:00Z"
-    mock_updated_at = Mock()
-    mock_updated_at.isoformat.return_value = "2024-01-02T00:00:00Z"
-    mock_model_info.created_at = mock_created_at
-    mock_model_info.updated_at = mock_updated_at
-    mock_model_info.last_modified = mock_updated_at
-    mock_model_info.sha = "abc123"
+    mock_model_info = make_model_info(
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+        last_modified=datetime(2024, 1, 2),
+    )
 
     model_data = scraper._extract_model_info(mock_model_info)
 
@@ -68,22 +75,23 @@ def test_extract_model_info(mock_settings, mock_hf_api):
     assert "url" in model_data
 
 
-def test_extract_model_info_with_none_values(mock_settings, mock_hf_api):
+def test_make_model_info_copies_mutable_defaults(make_model_info):
+    """Test that mutating one mock's tags does not leak into later mocks."""
+    make_model_info().tags.append("leaked")
+
+    assert make_model_info().tags == ["nlp", "bert"]
+
+
+def test_extract_model_info_with_none_values(scraper, make_model_info):
     """Test extracting model info when some fields are None."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
-    mock_model_info.id = "test/model"
-    mock_model_info.author = None
-    mock_model_info.downloads = None
-    mock_model_info.likes = None
-    mock_model_info.tags = []
-    mock_model_info.pipeline_tag = None
-    mock_model_info.library_name = None
-    mock_model_info.private = False
-    mock_model_info.created_at = None
-    mock_model_info.last_modified = None
-    mock_model_info.sha = "abc123"
+    mock_model_info = make_model_info(
+        author=None,
+        downloads=None,
+        likes=None,
+        tags=[],
+        pipeline_tag=None,
+        library_name=None,
+    )
 
     model_data = scraper._extract_model_info(mock_model_info)
 
@@ -94,18 +102,14 @@ def test_extract_model_info_with_none_values(mock_settings, mock_hf_api):
 
 
 @patch("huggingface_hub.ModelCard")
-def test_get_base_model_from_card(mock_model_card, mock_settings, mock_hf_api):
+def test_get_base_model_from_card(mock_model_card, scraper, make_model_info):
     """Test getting base model from model card."""
-    scraper = HuggingFaceScraper()
-
     # Mock ModelCard with base_model in data
     mock_card = Mock()
     mock_card.data = {"base_model": "base/model"}
     mock_model_card.load.return_value = mock_card
 
-    mock_model_info = Mock()
-    mock_model_info.id = "test/model"
-    mock_model_info.author = "test_author"
+    mock_model_info = make_model_info()
 
     base_model = scraper._get_base_model_from_card(mock_model_info)
 
@@ -115,31 +119,24 @@ def test_get_base_model_from_card(mock_model_card, mock_settings, mock_hf_api):
 
 @patch("huggingface_hub.ModelCard")
 def test_get_base_model_from_card_no_base_model(
-    mock_model_card, mock_settings, mock_hf_api
+    mock_model_card, scraper, make_model_info
 ):
     """Test getting base model when card has no base_model field."""
-    scraper = HuggingFaceScraper()
-
     # Mock ModelCard without base_model
     mock_card = Mock()
     mock_card.data = {}
     mock_model_card.load.return_value = mock_card
 
-    mock_model_info = Mock()
-    mock_model_info.id = "test/model"
-    mock_model_info.author = "test_author"
+    mock_model_info = make_model_info()
 
     base_model = scraper._get_base_model_from_card(mock_model_info)
 
     assert base_model is None
 
 
-def test_extract_relationships_based_on(mock_settings, mock_hf_api):
+def test_extract_relationships_based_on(scraper, make_model_info):
     """Test extracting relationship."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
-    mock_model_info.id = "child/model"
+    mock_model_info = make_model_info(id="child/model")
 
     model_data = {"model_id": "child/model"}
 
@@ -159,12 +156,9 @@ def test_extract_relationships_based_on(mock_settings, mock_hf_api):
         assert relationships[0]["target_type"] == "model"
 
 
-def test_extract_relationships_no_base_model(mock_settings, mock_hf_api):
+def test_extract_relationships_no_base_model(scraper, make_model_info):
     """Test extracting relationships when no base model exists."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
-    mock_model_info.id = "standalone/model"
+    mock_model_info = make_model_info(id="standalone/model")
 
     model_data = {"model_id": "standalone/model"}
 
@@ -174,49 +168,29 @@ def test_extract_relationships_no_base_model(mock_settings, mock_hf_api):
         assert len(relationships) == 0
 
 
-def test_infer_relationship_type_from_name(mock_settings, mock_hf_api):
+@pytest.mark.parametrize(
+    "model_id,base_model,expected",
+    [
+        # Quantization pattern - pattern is in model_id (first param)
+        ("base-model-4bit", "base-model", "quantizations"),
+        ("base-model-lora", "base-model", "adapters"),
+        ("base-model-merge", "base-model", "merges"),
+        # Default (finetuned when base_model exists and no pattern matches)
+        ("base-model-variant", "base-model", "finetuned"),
+        # None when model_id equals base_model (no relationship)
+        ("base-model", "base-model", None),
+        # None when base_model is empty (no base model)
+        ("standalone-model", "", None),
+    ],
+)
+def test_infer_relationship_type_from_name(scraper, model_id, base_model, expected):
     """Test inferring relationship type from model names."""
-    scraper = HuggingFaceScraper()
-
-    # Test quantization pattern - pattern is in model_id (first param)
-    rel_type = scraper._infer_relationship_type_from_name(
-        "base-model-4bit", "base-model"
-    )
-    assert rel_type == "quantizations"
-
-    # Test adapter pattern
-    rel_type = scraper._infer_relationship_type_from_name(
-        "base-model-lora", "base-model"
-    )
-    assert rel_type == "adapters"
-
-    # Test merge pattern
-    rel_type = scraper._infer_relationship_type_from_name(
-        "base-model-merge", "base-model"
-    )
-    assert rel_type == "merges"
+    assert scraper._infer_relationship_type_from_name(model_id, base_model) == expected
 
-    # Test default (finetuned when base_model exists and no pattern matches)
-    rel_type = scraper._infer_relationship_type_from_name(
-        "base-model-variant", "base-model"
-    )
-    assert rel_type == "finetuned"
-
-    # Test None when model_id equals base_model (no relationship)
-    rel_type = scraper._infer_relationship_type_from_name("base-model", "base-model")
-    assert rel_type is None
 
-    # Test None when base_model is empty (no base model)
-    rel_type = scraper._infer_relationship_type_from_name("standalone-model", "")
-    assert rel_type is None
-
-
-def test_extract_dataset_relationships_from_model(mock_settings, mock_hf_api):
+def test_extract_dataset_relationships_from_model(scraper, make_model_info):
     """Test extracting dataset relationships from model tags."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
-    mock_model_info.id = "test/model"
+    mock_model_info = make_model_info()
 
     model_data = {
         "model_id": "test/model",
@@ -237,11 +211,9 @@ def test_extract_dataset_relationships_from_model(mock_settings, mock_hf_api):
     assert datasets[1]["dataset_id"] == "author/glue"
 
 
-def test_extract_dataset_relationships_from_model_no_tags(mock_settings, mock_hf_api):
+def test_extract_dataset_relationships_from_model_no_tags(scraper, make_model_info):
     """Test extracting dataset relationships when model has no dataset tags."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
+    mock_model_info = make_model_info()
     model_data = {"model_id": "test/model", "tags": ["nlp", "bert"]}
 
     relationships, datasets = scraper._extract_dataset_relationships_from_model(
@@ -252,21 +224,12 @@ def test_extract_dataset_relationships_from_model_no_tags(mock_settings, mock_hf
     assert len(datasets) == 0
 
 
-@patch("scrapers.huggingface_scraper.time.sleep")
-def test_scrape_datasets(mock_sleep, mock_settings, mock_hf_api):
+def test_scrape_datasets(scraper, mock_hf_api, make_dataset_info):
     """Test scraping datasets."""
-    scraper = HuggingFaceScraper()
-
     # Mock dataset info
-    mock_dataset_info = Mock()
-    mock_dataset_info.id = "author/dataset1"
-    mock_dataset_info.author = "author"
-    mock_dataset_info.downloads = 1000
-    mock_dataset_info.tags = ["nlp"]
-    mock_dataset_info.created_at = None
-    mock_dataset_info.updated_at = None
-
-    mock_hf_api.dataset_info.return_value = mock_dataset_info
+    mock_hf_api.dataset_info.return_value = make_dataset_info(
+        id="author/dataset1", tags=["nlp"]
+    )
 
     with patch.object(
         scraper, "_extract_relationships_from_dataset_card", return_value=[]
@@ -279,20 +242,9 @@ def test_scrape_datasets(mock_sleep, mock_settings, mock_hf_api):
         mock_hf_api.dataset_info.assert_called_once_with("author/dataset1")
 
 
-@patch("scrapers.huggingface_scraper.time.sleep")
-def test_scrape_datasets_with_limit(mock_sleep, mock_settings, mock_hf_api):
+def test_scrape_datasets_with_limit(scraper, mock_hf_api, make_dataset_info):
     """Test scraping datasets with limit."""
-    scraper = HuggingFaceScraper()
-
-    mock_dataset_info = Mock()
-    mock_dataset_info.id = "author/dataset"
-    mock_dataset_info.author = "author"
-    mock_dataset_info.downloads = 1000
-    mock_dataset_info.tags = []
-    mock_dataset_info.created_at = None
-    mock_dataset_info.updated_at = None
-
-    mock_hf_api.dataset_info.return_value = mock_dataset_info
+    mock_hf_api.dataset_info.return_value = make_dataset_info()
 
     with patch.object(
         scraper, "_extract_relationships_from_dataset_card", return_value=[]
@@ -305,11 +257,8 @@ def test_scrape_datasets_with_limit(mock_sleep, mock_settings, mock_hf_api):
         assert mock_hf_api.dataset_info.call_count == 2
 
 
-@patch("scrapers.huggingface_scraper.time.sleep")
-def test_scrape_datasets_no_author(mock_sleep, mock_settings, mock_hf_api):
+def test_scrape_datasets_no_author(scraper, mock_hf_api):
     """Test scraping datasets without author in ID."""
-    scraper = HuggingFaceScraper()
-
     datasets, relationships = scraper.scrape_datasets(["dataset1"])
 
     # Should skip datasets without author
@@ -317,21 +266,13 @@ def test_scrape_datasets_no_author(mock_sleep, mock_settings, mock_hf_api):
     mock_hf_api.dataset_info.assert_not_called()
 
 
-def test_extract_dataset_info(mock_settings, mock_hf_api):
+def test_extract_dataset_info(scraper, make_dataset_info):
     """Test extracting dataset information."""
-    scraper = HuggingFaceScraper()
-
-    mock_dataset_info = Mock()
-    mock_dataset_info.id = "author/dataset"
-    mock_dataset_info.author = "author"
-    mock_dataset_info.downloads = 1000
-    mock_dataset_info.tags = ["nlp", "text"]
-    mock_created_at = Mock()
-    mock_created_at.isoformat.return_value = "2024-01-01T00:00:00Z"
-    mock_updated_at = Mock()
-    mock_updated_at.isoformat.return_value = "2024-01-02T00:00:00Z"
-    mock_dataset_info.created_at = mock_created_at
-    mock_dataset_info.updated_at = mock_updated_at
+    mock_dataset_info = make_dataset_info(
+        tags=["nlp", "text"],
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+    )
 
     dataset_data = scraper._extract_dataset_info(mock_dataset_info)
 
@@ -339,21 +280,13 @@ def test_extract_dataset_info(mock_settings, mock_hf_api):
     assert dataset_data["author"] == "author"
     assert dataset_data["downloads"] == 1000
     assert dataset_data["tags"] == ["nlp", "text"]
-    assert dataset_data["created_at"] == "2024-01-01T00:00:00Z"
-    assert dataset_data["updated_at"] == "2024-01-02T00:00:00Z"
+    assert dataset_data["created_at"] == "2024-01-01T00:00:00"
+    assert dataset_data["updated_at"] == "2024-01-02T00:00:00"
 
 
-def test_extract_dataset_info_none_dates(mock_settings, mock_hf_api):
+def test_extract_dataset_info_none_dates(scraper, make_dataset_info):
     """Test extracting dataset info when dates are None."""
-    scraper = HuggingFaceScraper()
-
-    mock_dataset_info = Mock()
-    mock_dataset_info.id = "author/dataset"
-    mock_dataset_info.author = "author"
-    mock_dataset_info.downloads = None
-    mock_dataset_info.tags = []
-    mock_dataset_info.created_at = None
-    mock_dataset_info.updated_at = None
+    mock_dataset_info = make_dataset_info(downloads=None)
 
     dataset_data = scraper._extract_dataset_info(mock_dataset_info)
 
@@ -362,10 +295,8 @@ def test_extract_dataset_info_none_dates(mock_settings, mock_hf_api):
 
 
 @patch("scrapers.huggingface_scraper.requests.get")
-def test_extract_relationships_from_dataset_card(mock_get, mock_settings, mock_hf_api):
+def test_extract_relationships_from_dataset_card(mock_get, scraper):
     """Test extracting relationships from dataset card."""
-    scraper = HuggingFaceScraper()
-
     # Mock HTML response with model links
     html_content = """
     <html>
@@ -395,12 +326,8 @@ def test_extract_relationships_from_dataset_card(mock_get, mock_settings, mock_h
 
 
 @patch("scrapers.huggingface_scraper.requests.get")
-def test_extract_relationships_from_dataset_card_no_models(
-    mock_get, mock_settings, mock_hf_api
-):
+def test_extract_relationships_from_dataset_card_no_models(mock_get, scraper):
     """Test extracting relationships when dataset card has no models section."""
-    scraper = HuggingFaceScraper()
-
     html_content = """
     <html>
     <body>
@@ -421,10 +348,8 @@ def test_extract_relationships_from_dataset_card_no_models(
 
 
 @patch("scrapers.huggingface_scraper.requests.get")
-def test_get_relationship_type_from_tree(mock_get, mock_settings, mock_hf_api):
+def test_get_relationship_type_from_tree(mock_get, scraper):
     """Test getting relationship type from siblings API."""
-    scraper = HuggingFaceScraper()
-
     # Mock successful API response
     mock_response = Mock()
     mock_response.status_code = 200
@@ -443,12 +368,8 @@ def test_get_relationship_type_from_tree(mock_get, mock_settings, mock_hf_api):
 
 
 @patch("scrapers.huggingface_scraper.requests.get")
-def test_get_relationship_type_from_tree_api_fails(
-    mock_get, mock_settings, mock_hf_api
-):
+def test_get_relationship_type_from_tree_api_fails(mock_get, scraper):
     """Test getting relationship type when API fails."""
-    scraper = HuggingFaceScraper()
-
     # Mock API failure
     mock_get.side_effect = Exception("API error")
 
@@ -461,24 +382,9 @@ def test_get_relationship_type_from_tree_api_fails(
         mock_infer.assert_called_once()
 
 
-def test_scrape_model_by_id(mock_settings, mock_hf_api):
+def test_scrape_model_by_id(scraper, mock_hf_api, make_model_info):
     """Test scraping a specific model by ID."""
-    scraper = HuggingFaceScraper()
-
-    mock_model_info = Mock()
-    mock_model_info.id = "test/model"
-    mock_model_info.author = "author"
-    mock_model_info.downloads = 1000
-    mock_model_info.likes = 50
-    mock_model_info.tags = ["nlp"]
-    mock_model_info.pipeline_tag = "text-classification"
-    mock_model_info.library_name = "transformers"
-    mock_model_info.private = False
-    mock_model_info.created_at = None
-    mock_model_info.last_modified = None
-    mock_model_info.sha = "abc123"
-
-    mock_hf_api.model_info.return_value = mock_model_info
+    mock_hf_api.model_info.return_value = make_model_info(author="author", tags=["nlp"])
 
     with patch.object(scraper, "_extract_relationships", return_value=[]):
         model_data, relationships = scraper.scrape_model_by_id("test/model")
@@ -488,10 +394,8 @@ def test_scrape_model_by_id(mock_settings, mock_hf_api):
         mock_hf_api.model_info.assert_called_once_with("test/model")
 
 
-def test_scrape_model_by_id_error(mock_settings, mock_hf_api):
+def test_scrape_model_by_id_error(scraper, mock_hf_api):
     """Test scraping model by ID when error occurs."""
-    scraper = HuggingFaceScraper()
-
     mock_hf_api.model_info.side_effect = Exception("Model not found")
 
     with pytest.raises(Exception, match="Model not found"):